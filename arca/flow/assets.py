@@ -1,5 +1,8 @@
 # dagster_sip/assets.py
 
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+
 from dagster import MetadataValue, Output, asset
 
 from arca.flow.mets_parser import parse_mets_to_sip
@@ -10,7 +13,32 @@ from arca.flow.pydantic_models import (
     RepresentationModel,
     SIPModel,
 )
-from arca.flow.utils import collect_dc_metadata, collect_fixity_details, group_fixities_by_file
+from arca.flow.utils import collect_dc_metadata, collect_fixity_metadata
+
+# Full ID/detail collections are embedded in the event log only for reasonably
+# sized SIPs; above this threshold a head sample plus the total count is
+# recorded instead, keeping per-run metadata (and UI render cost) bounded.
+_METADATA_LIST_LIMIT = 100
+
+
+def _bounded_json(key: str, values: list) -> dict[str, MetadataValue]:
+    """Emit a JSON metadata entry, truncated to a head sample when large."""
+    if len(values) <= _METADATA_LIST_LIMIT:
+        return {key: MetadataValue.json(values)}
+    return {
+        f"{key} (head)": MetadataValue.json(values[:_METADATA_LIST_LIMIT]),
+        f"{key} (total)": MetadataValue.int(len(values)),
+    }
+
+
+def _bounded_json_mapping(key: str, mapping: dict) -> dict[str, MetadataValue]:
+    """Emit a JSON metadata entry for a mapping, truncated when large."""
+    if len(mapping) <= _METADATA_LIST_LIMIT:
+        return {key: MetadataValue.json(mapping)}
+    return {
+        f"{key} (head)": MetadataValue.json(dict(islice(mapping.items(), _METADATA_LIST_LIMIT))),
+        f"{key} (total)": MetadataValue.int(len(mapping)),
+    }
 
 
 @asset(config_schema={"file_paths": [str]})
@@ -36,14 +64,19 @@ def sip_asset(context) -> Output[SIPModel]:
 
     # Parse the first file as the primary SIP
     primary_sip = parse_mets_to_sip(file_paths[0])
-    all_ie_ids = [ie.ie_id for ie in primary_sip.intellectual_entities]
 
-    # Process additional files if present
+    # Process additional files if present. Each METS file is parsed
+    # independently, so the additional files are fanned out to a small thread
+    # pool; executor.map preserves the input order of file_paths.
     if len(file_paths) > 1:
-        for file_path in file_paths[1:]:
-            additional_sip = parse_mets_to_sip(file_path)
-            primary_sip.intellectual_entities.extend(additional_sip.intellectual_entities)
-            all_ie_ids.extend([ie.ie_id for ie in additional_sip.intellectual_entities])
+        with ThreadPoolExecutor(max_workers=min(8, len(file_paths) - 1)) as executor:
+            additional_sips = list(executor.map(parse_mets_to_sip, file_paths[1:]))
+        primary_sip.intellectual_entities.extend(
+            chain.from_iterable(sip.intellectual_entities for sip in additional_sips)
+        )
+
+    # Derive IE IDs in a single pass over the combined entities
+    all_ie_ids = [ie.ie_id for ie in primary_sip.intellectual_entities]
 
     return Output(
         value=primary_sip,
@@ -51,7 +84,7 @@ def sip_asset(context) -> Output[SIPModel]:
             "File Paths": MetadataValue.json(file_paths),
             "SIP ID": MetadataValue.text(primary_sip.sip_id),
             "Intellectual Entity Count": MetadataValue.int(len(primary_sip.intellectual_entities)),
-            "IE IDs": MetadataValue.json(all_ie_ids),
+            **_bounded_json("IE IDs", all_ie_ids),
         },
     )
 
@@ -90,9 +123,7 @@ def representations(intellectual_entities: list[IEModel]) -> Output[list[Represe
                 - Representation Count: Total number of representations
                 - Representation IDs: List of unique representation identifiers
     """
-    reps: list[RepresentationModel] = []
-    for ie in intellectual_entities:
-        reps.extend(ie.representations)
+    reps = list(chain.from_iterable(ie.representations for ie in intellectual_entities))
 
     # Collect representation IDs
     rep_ids = [rep.rep_id for rep in reps]
@@ -101,7 +132,7 @@ def representations(intellectual_entities: list[IEModel]) -> Output[list[Represe
         value=reps,
         metadata={
             "Representation Count": MetadataValue.int(len(reps)),
-            "Representation IDs": MetadataValue.json(rep_ids),
+            **_bounded_json("Representation IDs", rep_ids),
         },
     )
 
@@ -123,9 +154,7 @@ def files(representations: list[RepresentationModel]) -> Output[list[FileModel]]
                 - File Count: Total number of files across all representations
                 - File Original Names: List of original filenames (excluding None values)
     """
-    all_files: list[FileModel] = []
-    for rep in representations:
-        all_files.extend(rep.files)
+    all_files = list(chain.from_iterable(rep.files for rep in representations))
 
     # Collect file original names, ignoring None
     file_names = [f.original_name for f in all_files if f.original_name]
@@ -134,7 +163,7 @@ def files(representations: list[RepresentationModel]) -> Output[list[FileModel]]
         value=all_files,
         metadata={
             "File Count": MetadataValue.int(len(all_files)),
-            "File Original Names": MetadataValue.json(file_names),
+            **_bounded_json("File Original Names", file_names),
         },
     )
 
@@ -150,22 +179,23 @@ def fixities(files: list[FileModel]) -> Output[list[FixityModel]]:
         Output containing list of fixity models and metadata about
         fixity counts and organization by file
     """
-    # Collect all fixities
+    # Build the file index and flatten fixities in a single pass over files
+    files_by_id: dict[str, FileModel] = {}
     all_fixities: list[FixityModel] = []
     for f in files:
+        files_by_id[f.file_id] = f
         all_fixities.extend(f.fixities)
 
-    # Process fixity information
-    files_by_id = {f.file_id: f for f in files}
-    fixity_details = collect_fixity_details(all_fixities, files_by_id)
-    fixities_by_file = group_fixities_by_file(fixity_details)
+    # Process fixity information (flat details and per-file grouping share
+    # one pass over the fixities)
+    fixity_details, fixities_by_file = collect_fixity_metadata(all_fixities, files_by_id)
 
     return Output(
         value=all_fixities,
         metadata={
             "Fixity Count": MetadataValue.int(len(all_fixities)),
-            "Fixities by File": MetadataValue.json(fixities_by_file),
-            "All Fixities": MetadataValue.json(fixity_details),
+            **_bounded_json_mapping("Fixities by File", fixities_by_file),
+            **_bounded_json("All Fixities", fixity_details),
         },
     )
 
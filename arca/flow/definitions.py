@@ -1,4 +1,6 @@
-from dagster import Definitions, EnvVar, load_assets_from_modules
+import os
+
+from dagster import Definitions, load_assets_from_modules
 
 from arca.flow import assets
 from arca.flow.sensors import (
@@ -10,14 +12,15 @@ from arca.flow.sensors import (
 
 all_assets = load_assets_from_modules([assets])
 
+# Resolved once at code-location load; a plain environ lookup avoids the
+# EnvVar round trip (the value was resolved eagerly here anyway).
+_test_data_path = os.environ.get("DAGSTER_TEST_DATA_PATH") or _default_test_data_path
+
 defs = Definitions(
     assets=all_assets,
     jobs=[ingest_sip_job],
     sensors=[xml_file_sensor],
     resources={
-        "test_data_path": TestDataPathResource(
-            path=EnvVar("DAGSTER_TEST_DATA_PATH").get_value(default=_default_test_data_path)
-            or _default_test_data_path,
-        ),
+        "test_data_path": TestDataPathResource(path=_test_data_path),
     },
 )
@@ -177,8 +177,8 @@ class FileModel(BaseModel):
     original_path: str | None = Field(None, description="Original file path")
     size_bytes: int = Field(..., description="File size in bytes")
     fixities: list[FixityModel] = Field(default_factory=list, description="File checksums")
-    dmd_ids: list[str] = Field(default_factory=list, description="Descriptive metadata IDs")
-    adm_ids: list[str] = Field(default_factory=list, description="Administrative metadata IDs")
+    dmd_ids: tuple[str, ...] = Field(default=(), description="Descriptive metadata IDs")
+    adm_ids: tuple[str, ...] = Field(default=(), description="Administrative metadata IDs")
 
 
 class RepresentationType(StrEnum):
@@ -220,6 +220,16 @@ class RepresentationType(StrEnum):
     ORIGINAL = "original"
 
 
+def _new_rep_id() -> str:
+    """Generate a default representation ID.
+
+    uuid4().hex returns the 32-character form directly, skipping the
+    hyphenated str(UUID) formatting, and a named function avoids a lambda
+    frame in Pydantic's default resolution.
+    """
+    return uuid4().hex
+
+
 class RepresentationModel(BaseModel):
     """
     Model for OAIS representation information, grouping related files.
@@ -272,7 +282,7 @@ class RepresentationModel(BaseModel):
     """
 
     rep_id: str = Field(
-        default_factory=lambda: str(uuid4()), description="Unique identifier for the representation"
+        default_factory=_new_rep_id, description="Unique identifier for the representation"
     )
     label: str | None = Field(None, description="Human-readable label")
     usage_type: RepresentationType | None = Field(
@@ -20,7 +20,7 @@ The sensor system provides:
     - Automated workflow triggering
     - File-specific run configuration
     - Error handling and skip conditions
-    - Run deduplication through run keys
+    - Run deduplication through mtime/size-fingerprinted run keys
     - Configurable monitoring behavior
 
 Usage:
@@ -30,6 +30,7 @@ Usage:
     ```
 """
 
+import os
 from pathlib import Path
 
 from dagster import (
@@ -85,24 +86,31 @@ def xml_file_sensor(
         context: Sensor evaluation context provided by Dagster.
         test_data_path: Resource providing the test data directory path.
     """
-    data_path = Path(test_data_path.path)
+    data_path = test_data_path.path
 
-    if not data_path.exists():
+    if not os.path.isdir(data_path):
         yield SkipReason(f"Test data directory {data_path} does not exist")
         return
 
-    # Get all XML files in the directory
-    xml_files = [f for f in data_path.glob("*.xml")]
+    # Get all XML files in the directory. os.scandir fills its DirEntry
+    # objects from one directory sweep, avoiding the per-match Path
+    # allocations and extra stat calls of Path.glob on every tick.
+    with os.scandir(data_path) as entries:
+        xml_files = [e for e in entries if e.name.endswith(".xml") and e.is_file()]
 
     if not xml_files:
         yield SkipReason("No XML files found in the test data directory")
         return
 
-    # Create a run request for each XML file
-    for xml_file in xml_files:
+    # Create a run request for each XML file. The run key carries the stat
+    # fingerprint (free from the DirEntry's cached stat), so Dagster's
+    # run-key dedup skips unchanged files cheaply while a rewritten file
+    # gets a fresh key and is processed again.
+    for entry in xml_files:
+        st = entry.stat()
         yield RunRequest(
-            run_key=f"xml_file_{xml_file.name}",
+            run_key=f"xml_file_{entry.name}_{st.st_mtime_ns}_{st.st_size}",
             run_config=RunConfig(
-                ops={"sip_asset": {"config": {"file_paths": [str(xml_file.absolute())]}}}
+                ops={"sip_asset": {"config": {"file_paths": [os.path.abspath(entry.path)]}}}
             ),
         )
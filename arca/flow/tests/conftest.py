@@ -1,7 +1,22 @@
 import pytest
+from dagster import DagsterInstance
 
 
 @pytest.fixture(autouse=True)
 def dagster_temp_home(tmp_path, monkeypatch):
     """Use system temp directory for Dagster home during tests."""
     monkeypatch.setenv("DAGSTER_HOME", str(tmp_path / "dagster_home"))
+
+
+@pytest.fixture(scope="session")
+def dagster_instance():
+    """One ephemeral Dagster instance shared by the whole session.
+
+    Constructing an instance bootstraps the in-memory event-log and run
+    storage; sharing it avoids repeating that setup per materialize call.
+    The event log accumulates across runs on the shared instance, so tests
+    must read events from their own ExecuteInProcessResult rather than from
+    the instance.
+    """
+    with DagsterInstance.ephemeral() as instance:
+        yield instance
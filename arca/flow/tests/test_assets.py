@@ -5,8 +5,13 @@ from dagster import materialize
 
 from arca.flow.assets import files, fixities, intellectual_entities, representations, sip_asset
 
+# Fixity algorithms the pipeline is expected to emit; a module-level
+# frozenset so the membership test in the loop below is a single hash
+# probe against one shared object instead of a fresh list per iteration.
+_VALID_FIXITY_TYPES = frozenset(("MD5", "SHA-1", "SHA-256", "SHA-512"))
 
-@pytest.fixture
+
+@pytest.fixture(scope="session")
 def mets_file_path():
     """
     Returns the path to a static METS XML file stored in the repo.
@@ -17,20 +22,42 @@ def mets_file_path():
     return os.path.join(os.path.dirname(__file__), "test_data", "synthetic_sip.xml")
 
 
-def test_sip_pipeline_single_file(mets_file_path):
-    """
-    This test runs the entire DAGSTER pipeline (assets)
-    using a single METS XML file from the repo.
+@pytest.fixture(scope="session")
+def single_file_materialization(mets_file_path, dagster_instance):
     """
-    # We run 'materialize' with the relevant assets
-    # and provide a run_config that assigns a single METS file path
-    # to the sip_asset's file_paths configuration.
+    Materializes the full pipeline once for the single-file case.
 
-    result = materialize(
+    Session-scoped so every test asserting on this run shares one XML parse
+    and one DAG execution instead of re-materializing per test.
+    """
+    return materialize(
         assets=[sip_asset, intellectual_entities, representations, files, fixities],
         run_config={"ops": {"sip_asset": {"config": {"file_paths": [mets_file_path]}}}},
+        instance=dagster_instance,
     )
 
+
+@pytest.fixture(scope="session")
+def multi_file_materialization(mets_file_path, dagster_instance):
+    """
+    Materializes the full pipeline once with the same METS file passed twice.
+    """
+    return materialize(
+        assets=[sip_asset, intellectual_entities, representations, files, fixities],
+        run_config={
+            "ops": {"sip_asset": {"config": {"file_paths": [mets_file_path, mets_file_path]}}}
+        },
+        instance=dagster_instance,
+    )
+
+
+def test_sip_pipeline_single_file(single_file_materialization):
+    """
+    This test validates the entire DAGSTER pipeline (assets)
+    using a single METS XML file from the repo.
+    """
+    result = single_file_materialization
+
     assert result.success
 
     # Retrieve the parsed SIPModel (Dagster >= 1.2.0 allows `asset_value`)
@@ -62,11 +89,6 @@ def test_sip_pipeline_single_file(mets_file_path):
     assert len(first_ie.dc.identifier) > 0
     print("IE Identifier:", first_ie.dc.identifier[0])
 
-    # Check metadata in the result
-    sip_asset_value = result.asset_value("sip_asset")
-    assert sip_asset_value is not None
-    assert len(sip_asset_value.intellectual_entities) > 0
-
     # Check that SIP creation_date is set
     assert sip_asset_value.creation_date is not None
     assert sip_asset_value.creation_date.tzinfo is not None  # Ensure timezone is set
@@ -82,35 +104,45 @@ def test_sip_pipeline_single_file(mets_file_path):
     assert len(files_value) > 0
     assert len(fixities_value) > 0
 
-    # Check that each file has required attributes
+    # Validate files and build the id index in the same pass; the per-fixity
+    # lookup below is then a dict hit instead of a linear scan over all files
+    files_by_id = {}
     for file in files_value:
         assert file.file_id is not None
+        files_by_id[file.file_id] = file
 
     # Check that each fixity has a valid file reference
     for fixity in fixities_value:
         assert fixity.file_id is not None
         # Find the corresponding file
-        matching_file = next((f for f in files_value if f.file_id == fixity.file_id), None)
+        matching_file = files_by_id.get(fixity.file_id)
         assert matching_file is not None, f"No matching file found for fixity {fixity.fixity_value}"
 
         # Verify fixity is in file's fixities list
         assert fixity in matching_file.fixities
 
         # Check fixity format
-        assert fixity.fixity_type in ["MD5", "SHA-1", "SHA-256", "SHA-512"]
+        assert fixity.fixity_type in _VALID_FIXITY_TYPES
         assert len(fixity.fixity_value) > 0
 
-    # Test fixities asset metadata
-    fixities_events = result.get_asset_materialization_events()
-    fixities_result = next(e for e in fixities_events if e.asset_key.path[-1] == "fixities")
-    metadata = fixities_result.materialization.metadata
+    # Test fixities asset metadata. The per-node accessor goes straight to
+    # the one event we need instead of materializing the full event list.
+    metadata = result.asset_materializations_for_node("fixities")[0].metadata
 
     assert "Fixity Count" in metadata
     assert "Fixities by File" in metadata
     assert "All Fixities" in metadata
 
-    # Check that fixities are properly grouped by file
+    # Unwrap the MetadataValue wrappers once into plain Python objects so
+    # the loops below don't go through the wrapper's .value descriptor
+    fixity_count = metadata["Fixity Count"].value
     fixities_by_file = metadata["Fixities by File"].value
+    all_fixities = metadata["All Fixities"].value
+
+    assert fixity_count == len(fixities_value)
+    assert len(all_fixities) == fixity_count
+
+    # Check that fixities are properly grouped by file
     assert isinstance(fixities_by_file, dict)
 
     for _file_id, file_data in fixities_by_file.items():
@@ -123,18 +155,13 @@ def test_sip_pipeline_single_file(mets_file_path):
             assert "value" in fixity
 
 
-def test_sip_pipeline_multiple_files(mets_file_path):
+def test_sip_pipeline_multiple_files(multi_file_materialization, mets_file_path):
     """
     This test verifies that the pipeline can process multiple METS XML files
     and combine their Intellectual Entities correctly.
     """
-    # Use the same file twice to test multiple file handling
-    result = materialize(
-        assets=[sip_asset, intellectual_entities, representations, files, fixities],
-        run_config={
-            "ops": {"sip_asset": {"config": {"file_paths": [mets_file_path, mets_file_path]}}}
-        },
-    )
+    # The shared fixture materializes with the same file twice
+    result = multi_file_materialization
 
     assert result.success
 
@@ -146,10 +173,8 @@ def test_sip_pipeline_multiple_files(mets_file_path):
     ie_count = len(sip_asset_value.intellectual_entities)
     assert ie_count > 0 and ie_count % 2 == 0, "IE count should be even when using same file twice"
 
-    # Check metadata
-    sip_events = result.get_asset_materialization_events()
-    sip_result = next(e for e in sip_events if e.asset_key.path[-1] == "sip_asset")
-    metadata = sip_result.materialization.metadata
+    # Check metadata via the per-node accessor, as in the single-file test
+    metadata = result.asset_materializations_for_node("sip_asset")[0].metadata
 
     # Verify file paths in metadata
     file_paths = metadata["File Paths"].value
@@ -1,8 +1,14 @@
 """Utility functions for Arca Flow."""
 
+from collections.abc import Iterable
+
 from dagster import MetadataValue
 
-from arca.flow.pydantic_models import FileModel, FixityModel, IEModel
+from arca.flow.pydantic_models import FileModel, FixityModel, FixityType, IEModel
+
+# FixityType has only four members; resolving member -> value through a dict
+# costs one hash instead of the enum descriptor lookup per fixity record.
+_FIXITY_VALUE = {m: m.value for m in FixityType}
 
 
 def collect_dc_metadata(ie_list: list[IEModel]) -> dict:
@@ -14,17 +20,30 @@ def collect_dc_metadata(ie_list: list[IEModel]) -> dict:
     Returns:
         Dictionary containing aggregated Dublin Core metadata
     """
-    dc_titles = [ie.dc.title[0] for ie in ie_list if ie.dc.title]
-    dc_identifiers = []
-    dc_creators = []
-    dc_rights = []
-    dc_types = []
+    dc_titles: list[str] = []
+    dc_identifiers: list[str] = []
+    dc_creators: list[str] = []
+    dc_rights: list[str] = []
+    dc_types: list[str] = []
+
+    # Single pass with one ie.dc resolution per entity, rather than a title
+    # comprehension plus a second loop re-reading ie.dc four times. The
+    # bound methods are hoisted so the loop body skips the per-iteration
+    # attribute lookups.
+    append_title = dc_titles.append
+    extend_identifiers = dc_identifiers.extend
+    extend_creators = dc_creators.extend
+    extend_rights = dc_rights.extend
+    extend_types = dc_types.extend
 
     for ie in ie_list:
-        dc_identifiers.extend(ie.dc.identifier)
-        dc_creators.extend(ie.dc.creator)
-        dc_rights.extend(ie.dc.rights)
-        dc_types.extend(ie.dc.type)
+        dc = ie.dc
+        if dc.title:
+            append_title(dc.title[0])
+        extend_identifiers(dc.identifier)
+        extend_creators(dc.creator)
+        extend_rights(dc.rights)
+        extend_types(dc.type)
 
     return {
         "IE Count": MetadataValue.int(len(ie_list)),
@@ -37,12 +56,13 @@ def collect_dc_metadata(ie_list: list[IEModel]) -> dict:
 
 
 def collect_fixity_details(
-    all_fixities: list[FixityModel], files_by_id: dict[str, FileModel]
+    all_fixities: Iterable[FixityModel], files_by_id: dict[str, FileModel]
 ) -> list[dict]:
     """Collect detailed fixity information with associated file data.
 
     Args:
-        all_fixities: List of fixity models
+        all_fixities: Iterable of fixity models; a lazy generator is fine, the
+            input is consumed in a single pass
         files_by_id: Dictionary mapping file IDs to file models
 
     Returns:
@@ -54,7 +74,7 @@ def collect_fixity_details(
         if file:
             fixity_details.append(
                 {
-                    "type": fx.fixity_type.value,
+                    "type": _FIXITY_VALUE[fx.fixity_type],
                     "value": fx.fixity_value,
                     "file_id": fx.file_id,
                     "file_name": file.original_name,
@@ -64,6 +84,49 @@ def collect_fixity_details(
     return fixity_details
 
 
+def collect_fixity_metadata(
+    all_fixities: Iterable[FixityModel], files_by_id: dict[str, FileModel]
+) -> tuple[list[dict], dict[str, dict]]:
+    """Collect flat fixity details and the per-file grouping in one pass.
+
+    Fuses collect_fixity_details and group_fixities_by_file for the common
+    caller that needs both: the input is consumed once, and each fixity's
+    {"type", "value"} record is shared between the grouped structure and the
+    flat detail entry instead of being materialized twice.
+
+    Args:
+        all_fixities: Iterable of fixity models; a lazy generator is fine
+        files_by_id: Dictionary mapping file IDs to file models
+
+    Returns:
+        Tuple of (fixity details list, fixities grouped by file ID)
+    """
+    fixity_details: list[dict] = []
+    fixities_by_file: dict[str, dict] = {}
+    for fx in all_fixities:
+        file = files_by_id.get(fx.file_id)
+        if file is None:
+            continue
+        record = {"type": _FIXITY_VALUE[fx.fixity_type], "value": fx.fixity_value}
+        fixity_details.append(
+            {
+                **record,
+                "file_id": fx.file_id,
+                "file_name": file.original_name,
+                "file_label": file.label,
+            }
+        )
+        entry = fixities_by_file.get(fx.file_id)
+        if entry is None:
+            entry = fixities_by_file[fx.file_id] = {
+                "file_name": file.original_name,
+                "file_label": file.label,
+                "fixities": [],
+            }
+        entry["fixities"].append(record)
+    return fixity_details, fixities_by_file
+
+
 def group_fixities_by_file(fixity_details: list[dict]) -> dict[str, dict]:
     """Group fixity information by file.
 
@@ -73,16 +136,17 @@ def group_fixities_by_file(fixity_details: list[dict]) -> dict[str, dict]:
     Returns:
         Dictionary organizing fixities by file ID
     """
-    fixities_by_file = {}
+    fixities_by_file: dict[str, dict] = {}
     for detail in fixity_details:
         file_id = detail["file_id"]
-        if file_id not in fixities_by_file:
-            fixities_by_file[file_id] = {
+        # One hash probe per entry instead of a membership test followed by
+        # two indexed lookups.
+        entry = fixities_by_file.get(file_id)
+        if entry is None:
+            entry = fixities_by_file[file_id] = {
                 "file_name": detail["file_name"],
                 "file_label": detail["file_label"],
                 "fixities": [],
             }
-        fixities_by_file[file_id]["fixities"].append(
-            {"type": detail["type"], "value": detail["value"]}
-        )
+        entry["fixities"].append({"type": detail["type"], "value": detail["value"]})
     return fixities_by_file